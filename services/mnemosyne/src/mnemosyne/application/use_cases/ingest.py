@@ -3,12 +3,13 @@ from __future__ import annotations
 import hashlib
 import textwrap
 import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from mnemosyne.domain.contracts import KnowledgeRepository, RawDocumentStorage, TextIndex
-from mnemosyne.domain.entities.models import AuditEvent, KnowledgeEntry, Source, Tag, Version
+from mnemosyne.domain.entities.models import AuditEvent, IngestionRun, KnowledgeEntry, Source, Tag, Version
 
 
 @dataclass
@@ -31,105 +32,201 @@ class IngestionResult:
     deduplicated: bool = False
 
 
+@dataclass(frozen=True)
+class PreparedDocument:
+    """Output of the CPU-bound normalize/enrich/summarize steps for one request."""
+
+    normalized_content: str
+    fingerprint: str
+    summary: str
+
+
+def prepare_document(content: str, summary: Optional[str] = None) -> PreparedDocument:
+    """Pure pre-processing of a request; module-level so it can run in a worker process."""
+    normalized_content = IngestionPipeline._normalize(content)
+    return PreparedDocument(
+        normalized_content=normalized_content,
+        fingerprint=IngestionPipeline._fingerprint(normalized_content),
+        summary=summary or IngestionPipeline._summarize(normalized_content),
+    )
+
+
+@dataclass
+class _BatchWrites:
+    """Writes buffered while a batch is processed, flushed once per collection at the end."""
+
+    entries: Dict[str, KnowledgeEntry] = field(default_factory=dict)
+    indexed: Dict[str, KnowledgeEntry] = field(default_factory=dict)
+    runs: List[IngestionRun] = field(default_factory=list)
+    audit_events: List[AuditEvent] = field(default_factory=list)
+
+
 class IngestionPipeline:
     def __init__(
         self,
         repository: KnowledgeRepository,
         index: TextIndex,
         storage: RawDocumentStorage | None = None,
+        workers: int | None = None,
+        parallel_min_bytes: int = 1_000_000,
     ) -> None:
         self.repository = repository
         self.index = index
         self.storage = storage
+        # Pre-processing moves to a process pool only when there is enough content to pay for pickling.
+        self.workers = workers or 0
+        self.parallel_min_bytes = parallel_min_bytes
+        self._executor: Executor | None = None
 
     def run(self, requests: List[IngestionRequest]) -> List[IngestionResult]:
-        results: List[IngestionResult] = []
+        """
+        Ingest a batch of requests.
+
+        Existing runs and entries are prefetched with one bulk read each and every write is buffered
+        until the end of the batch, so a batch costs a constant number of repository round trips.
+        Results and idempotency are the same as processing the requests one by one.
+        """
+        if not requests:
+            return []
 
-        for request in requests:
-            run_id = request.run_id or str(uuid.uuid4())
+        run_ids = [request.run_id or str(uuid.uuid4()) for request in requests]
+        finished_runs: Dict[str, IngestionRun] = {
+            run.run_id: run for run in self.repository.get_runs([r.run_id for r in requests if r.run_id])
+        }
+        entry_ids = {
+            self._entry_id(request)
+            for request, run_id in zip(requests, run_ids)
+            if run_id not in finished_runs
+        }
+        entries = {entry.id: entry for entry in self.repository.get_entries(sorted(entry_ids))}
+
+        prepared = self._prepare(
+            [(i, request) for i, (request, run_id) in enumerate(zip(requests, run_ids)) if run_id not in finished_runs]
+        )
 
+        batch = _BatchWrites()
+        results: List[IngestionResult] = []
+        for i, (request, run_id) in enumerate(zip(requests, run_ids)):
             # Idempotent: return previous run if already processed
-            existing_run = self.repository.get_run(run_id)
+            existing_run = finished_runs.get(run_id)
             if existing_run:
                 results.extend(existing_run.results)
                 continue
 
-            audit_events: List[AuditEvent] = []
-
-            # Persist raw content if storage configured
-            raw_uri = None
-            if self.storage:
-                raw_uri = self.storage.store(run_id=run_id, external_id=request.external_id, content=request.content)
-                audit_events.append(
-                    AuditEvent(
-                        run_id=run_id,
-                        step="persist_raw",
-                        status="ok",
-                        entry_id=request.external_id,
-                        metadata={"uri": raw_uri},
-                    )
-                )
+            run = self._process(request, run_id, prepared[i], entries, batch)
+            finished_runs[run_id] = run
+            results.extend(run.results)
+
+        self._flush(batch)
+        return results
 
-            # Normalize
-            normalized_content = self._normalize(request.content)
-            audit_events.append(AuditEvent(run_id=run_id, step="normalize", status="ok", entry_id=request.external_id))
-
-            # Enrich
-            fingerprint = self._fingerprint(normalized_content)
-            audit_events.append(AuditEvent(run_id=run_id, step="enrich", status="ok", entry_id=request.external_id))
-
-            # Summarize
-            summary = request.summary or self._summarize(normalized_content)
-            audit_events.append(AuditEvent(run_id=run_id, step="summarize", status="ok", entry_id=request.external_id))
-
-            # Persist + versioning
-            entry_id = f"{request.source.id}:{request.external_id}"
-            entry = self.repository.get_entry(entry_id)
-            deduplicated = False
-
-            if entry and entry.latest_version and entry.latest_version.fingerprint == fingerprint:
-                deduplicated = True
-                audit_events.append(AuditEvent(run_id=run_id, step="persist", status="deduplicated", entry_id=entry_id))
-            else:
-                if not entry:
-                    entry = KnowledgeEntry(id=entry_id, source=request.source, external_id=request.external_id)
-                version = Version(
-                    fingerprint=fingerprint,
-                    normalized_content=normalized_content,
-                    summary=summary,
-                    tags=request.tags,
-                    taxonomy=request.taxonomy,
-                    raw_uri=raw_uri,
+    def _process(
+        self,
+        request: IngestionRequest,
+        run_id: str,
+        prepared: PreparedDocument,
+        entries: Dict[str, KnowledgeEntry],
+        batch: "_BatchWrites",
+    ) -> IngestionRun:
+        audit_events: List[AuditEvent] = []
+
+        # Persist raw content if storage configured
+        raw_uri = None
+        if self.storage:
+            raw_uri = self.storage.store(run_id=run_id, external_id=request.external_id, content=request.content)
+            audit_events.append(
+                AuditEvent(
+                    run_id=run_id,
+                    step="persist_raw",
+                    status="ok",
+                    entry_id=request.external_id,
+                    metadata={"uri": raw_uri},
                 )
-                entry.add_version(version)
-                self.repository.save_entry(entry)
-                audit_events.append(AuditEvent(run_id=run_id, step="persist", status="versioned", entry_id=entry_id))
+            )
+
+        # Normalize, enrich and summarize already ran in the pre-processing stage
+        normalized_content = prepared.normalized_content
+        audit_events.append(AuditEvent(run_id=run_id, step="normalize", status="ok", entry_id=request.external_id))
+
+        fingerprint = prepared.fingerprint
+        audit_events.append(AuditEvent(run_id=run_id, step="enrich", status="ok", entry_id=request.external_id))
 
-            # Index latest version for search
-            self.index.index(entry)
-            audit_events.append(AuditEvent(run_id=run_id, step="index", status="ok", entry_id=entry_id))
+        summary = prepared.summary
+        audit_events.append(AuditEvent(run_id=run_id, step="summarize", status="ok", entry_id=request.external_id))
 
-            result = IngestionResult(
-                entry_id=entry.id,
-                version_id=entry.latest_version.id if entry.latest_version else "",
+        # Persist + versioning
+        entry_id = self._entry_id(request)
+        entry = entries.get(entry_id)
+        deduplicated = False
+
+        if entry and entry.latest_version and entry.latest_version.fingerprint == fingerprint:
+            deduplicated = True
+            audit_events.append(AuditEvent(run_id=run_id, step="persist", status="deduplicated", entry_id=entry_id))
+        else:
+            if not entry:
+                entry = KnowledgeEntry(id=entry_id, source=request.source, external_id=request.external_id)
+                entries[entry_id] = entry
+            version = Version(
                 fingerprint=fingerprint,
-                run_id=run_id,
-                deduplicated=deduplicated,
+                normalized_content=normalized_content,
+                summary=summary,
+                tags=request.tags,
+                taxonomy=request.taxonomy,
+                raw_uri=raw_uri,
             )
-            results.append(result)
+            entry.add_version(version)
+            batch.entries[entry.id] = entry
+            audit_events.append(AuditEvent(run_id=run_id, step="persist", status="versioned", entry_id=entry_id))
 
-            self.repository.record_run(
-                self._build_run(run_id=run_id, request=request, result=result, audit_events=audit_events)
-            )
-            self.repository.record_audit_events(audit_events)
+        # Index latest version for search
+        batch.indexed[entry.id] = entry
+        audit_events.append(AuditEvent(run_id=run_id, step="index", status="ok", entry_id=entry_id))
 
-        return results
+        result = IngestionResult(
+            entry_id=entry.id,
+            version_id=entry.latest_version.id if entry.latest_version else "",
+            fingerprint=fingerprint,
+            run_id=run_id,
+            deduplicated=deduplicated,
+        )
+        run = self._build_run(run_id=run_id, request=request, result=result, audit_events=audit_events)
+        batch.runs.append(run)
+        batch.audit_events.extend(audit_events)
+        return run
+
+    def _prepare(self, pending: List[Tuple[int, IngestionRequest]]) -> Dict[int, PreparedDocument]:
+        contents = [request.content for _, request in pending]
+        summaries = [request.summary for _, request in pending]
+        if self.workers > 1 and len(pending) > 1 and sum(map(len, contents)) >= self.parallel_min_bytes:
+            chunksize = max(1, len(pending) // (self.workers * 4))
+            documents = list(self._get_executor().map(prepare_document, contents, summaries, chunksize=chunksize))
+        else:
+            documents = [prepare_document(content, summary) for content, summary in zip(contents, summaries)]
+        return {i: document for (i, _), document in zip(pending, documents)}
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _flush(self, batch: "_BatchWrites") -> None:
+        if batch.entries:
+            self.repository.save_entries(list(batch.entries.values()))
+        if batch.indexed:
+            self.index.index_many(list(batch.indexed.values()))
+        if batch.runs:
+            self.repository.record_runs(batch.runs)
+        if batch.audit_events:
+            self.repository.record_audit_events(batch.audit_events)
 
     def _build_run(
         self, run_id: str, request: IngestionRequest, result: IngestionResult, audit_events: List[AuditEvent]
-    ):
-        from mnemosyne.domain.entities.models import IngestionRun
-
+    ) -> IngestionRun:
         recorded_request = replace(request, run_id=run_id)
 
         return IngestionRun(
@@ -141,6 +238,10 @@ class IngestionPipeline:
             finished_at=datetime.now(timezone.utc),
         )
 
+    @staticmethod
+    def _entry_id(request: IngestionRequest) -> str:
+        return f"{request.source.id}:{request.external_id}"
+
     @staticmethod
     def _normalize(content: str) -> str:
         return "\n".join(line.strip() for line in content.strip().splitlines())
@@ -17,11 +17,28 @@ class SearchKnowledgeUseCase:
         tags: Optional[List[str]] = None,
         taxonomy: Optional[List[str]] = None,
         source_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[KnowledgeEntry]:
+        entry_ids = self._search_page(text, tags, taxonomy, source_types, limit, offset)
+        return self.repository.get_entries(entry_ids)
+
+    def _search_page(
+        self,
+        text: Optional[str],
+        tags: Optional[List[str]],
+        taxonomy: Optional[List[str]],
+        source_types: Optional[List[str]],
+        limit: Optional[int],
+        offset: int,
+    ) -> List[str]:
+        # Ranked indexes select the page themselves; plain ones are sliced after the fact.
+        search_ranked = getattr(self.index, "search_ranked", None)
+        if search_ranked:
+            ranked = search_ranked(
+                text=text, tags=tags, taxonomy=taxonomy, source_types=source_types, limit=limit, offset=offset
+            )
+            return [entry_id for entry_id, _ in ranked]
         entry_ids = self.index.search(text=text, tags=tags, taxonomy=taxonomy, source_types=source_types)
-        results: List[KnowledgeEntry] = []
-        for entry_id in entry_ids:
-            entry = self.repository.get_entry(entry_id)
-            if entry:
-                results.append(entry)
-        return results
+        end = None if limit is None else offset + limit
+        return entry_ids[offset:end]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Protocol
+from typing import Iterable, List, Optional, Protocol, Tuple
 
 from mnemosyne.domain.entities.models import AuditEvent, IngestionRun, KnowledgeEntry
 
@@ -9,18 +9,34 @@ class KnowledgeRepository(Protocol):
     def get_entry(self, entry_id: str) -> Optional[KnowledgeEntry]:
         ...
 
+    def get_entries(self, entry_ids: List[str]) -> List[KnowledgeEntry]:
+        """Fetch several entries at once, in the order requested; unknown ids are skipped."""
+        ...
+
     def save_entry(self, entry: KnowledgeEntry) -> None:
         ...
 
+    def save_entries(self, entries: List[KnowledgeEntry]) -> None:
+        """Persist several entries with a single bulk write."""
+        ...
+
     def list_entries(self) -> Iterable[KnowledgeEntry]:
         ...
 
     def record_run(self, run: IngestionRun) -> None:
         ...
 
+    def record_runs(self, runs: List[IngestionRun]) -> None:
+        """Persist several runs with a single bulk write."""
+        ...
+
     def get_run(self, run_id: str) -> Optional[IngestionRun]:
         ...
 
+    def get_runs(self, run_ids: List[str]) -> List[IngestionRun]:
+        """Fetch the runs that exist among ``run_ids`` with a single read."""
+        ...
+
     def record_audit_events(self, events: List[AuditEvent]) -> None:
         ...
 
@@ -29,6 +45,10 @@ class TextIndex(Protocol):
     def index(self, entry: KnowledgeEntry) -> None:
         ...
 
+    def index_many(self, entries: List[KnowledgeEntry]) -> None:
+        """Index several entries with a single bulk write."""
+        ...
+
     def search(
         self,
         text: Optional[str] = None,
@@ -39,6 +59,22 @@ class TextIndex(Protocol):
         ...
 
 
+class RankedTextIndex(TextIndex, Protocol):
+    """Index able to score matches and return a single page of them."""
+
+    def search_ranked(
+        self,
+        text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        taxonomy: Optional[List[str]] = None,
+        source_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Tuple[str, float]]:
+        """Return ``(entry_id, score)`` pairs, best first."""
+        ...
+
+
 class RawDocumentStorage(Protocol):
     """Abstraction for storing raw documents (e.g., S3, local)."""
 
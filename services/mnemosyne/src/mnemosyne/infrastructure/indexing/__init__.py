@@ -1,4 +1,5 @@
 from mnemosyne.infrastructure.indexing.mongo_index import MongoTextIndex
 from mnemosyne.infrastructure.indexing.simple_index import SimpleTextIndex
+from mnemosyne.infrastructure.indexing.tokenizer import tokenize
 
-__all__ = ["SimpleTextIndex", "MongoTextIndex"]
+__all__ = ["SimpleTextIndex", "MongoTextIndex", "tokenize"]
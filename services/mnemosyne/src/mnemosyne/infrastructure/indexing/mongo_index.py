@@ -1,62 +1,114 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from pymongo import UpdateOne
 from pymongo.collection import Collection
 
 from mnemosyne.domain.contracts import TextIndex
 from mnemosyne.domain.entities.models import KnowledgeEntry
+from mnemosyne.infrastructure.indexing.tokenizer import tokenize
 
 
 class MongoTextIndex(TextIndex):
     """
-    Lightweight Mongo-backed index.
+    Mongo-backed index.
 
-    Uses a dedicated collection with a projected document for filtering without requiring full-text indexes.
+    Each entry is projected into a small document whose ``tokens``, ``tags`` and ``taxonomy`` arrays carry
+    multikey indexes, so every filter runs server-side and only ``entry_id`` travels back to the API.
     """
 
-    def __init__(self, collection: Collection) -> None:
+    def __init__(self, collection: Collection, batch_size: int = 500) -> None:
         self.collection = collection
+        self.batch_size = batch_size
         self.collection.create_index("entry_id", unique=True)
         self.collection.create_index("source_type")
+        self.collection.create_index("tokens")
+        self.collection.create_index("tags")
+        self.collection.create_index("taxonomy")
 
     def index(self, entry: KnowledgeEntry) -> None:
+        doc = self._to_doc(entry)
+        if doc:
+            self.collection.update_one({"entry_id": entry.id}, {"$set": doc}, upsert=True)
+
+    def index_many(self, entries: List[KnowledgeEntry]) -> None:
+        operations = [
+            UpdateOne({"entry_id": entry.id}, {"$set": doc}, upsert=True)
+            for entry in entries
+            if (doc := self._to_doc(entry))
+        ]
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        taxonomy: Optional[List[str]] = None,
+        source_types: Optional[List[str]] = None,
+    ) -> List[str]:
+        query = self._build_query(text, tags, taxonomy, source_types)
+        if query is None:
+            return []
+        return list(self._stream(query))
+
+    def search_ranked(
+        self,
+        text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        taxonomy: Optional[List[str]] = None,
+        source_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Tuple[str, float]]:
+        """Return one page of matches; the token-array index does not score, so every score is ``0.0``."""
+        query = self._build_query(text, tags, taxonomy, source_types)
+        if query is None:
+            return []
+        return [(entry_id, 0.0) for entry_id in self._stream(query, limit=limit, offset=offset)]
+
+    @staticmethod
+    def _to_doc(entry: KnowledgeEntry) -> Optional[Dict[str, object]]:
         version = entry.latest_version
         if not version:
-            return
-        doc: Dict[str, object] = {
+            return None
+        text = f"{version.normalized_content}\n{version.summary}"
+        return {
             "entry_id": entry.id,
-            "text": f"{version.normalized_content}\n{version.summary}".lower(),
+            "text": text.lower(),
+            "tokens": sorted(set(tokenize(text))),
             "tags": [t.key for t in version.tags],
             "taxonomy": version.taxonomy,
             "source_type": entry.source.type.value if hasattr(entry.source.type, "value") else entry.source.type,
         }
-        self.collection.update_one({"entry_id": entry.id}, {"$set": doc}, upsert=True)
 
-    def search(
+    def _build_query(
         self,
-        text: Optional[str] = None,
-        tags: Optional[List[str]] = None,
-        taxonomy: Optional[List[str]] = None,
-        source_types: Optional[List[str]] = None,
-    ) -> List[str]:
+        text: Optional[str],
+        tags: Optional[List[str]],
+        taxonomy: Optional[List[str]],
+        source_types: Optional[List[str]],
+    ) -> Optional[Dict[str, object]]:
         query: Dict[str, object] = {}
+        if text:
+            tokens = sorted(set(tokenize(text)))
+            if not tokens:
+                return None
+            query["tokens"] = {"$all": tokens}
+        if tags:
+            query["tags"] = {"$in": list(tags)}
+        if taxonomy:
+            query["taxonomy"] = {"$in": list(taxonomy)}
         if source_types:
             query["source_type"] = {"$in": list(source_types)}
-        docs = list(self.collection.find(query))
-        results: List[str] = []
-        text_q = (text or "").lower()
-        tag_filter: Set[str] = set(tags or [])
-        tax_filter: Set[str] = set(taxonomy or [])
-
-        for doc in docs:
-            if text_q and text_q not in (doc.get("text") or ""):
-                continue
-            doc_tags = set(doc.get("tags", []))
-            doc_tax = set(doc.get("taxonomy", []))
-            if tag_filter and not (tag_filter & doc_tags):
-                continue
-            if tax_filter and not (tax_filter & doc_tax):
-                continue
-            results.append(str(doc.get("entry_id")))
-        return results
+        return query
+
+    def _stream(self, query: Dict[str, object], limit: Optional[int] = None, offset: int = 0) -> Iterator[str]:
+        cursor = self.collection.find(query, {"entry_id": 1, "_id": 0}).batch_size(self.batch_size)
+        if offset:
+            cursor = cursor.skip(offset)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        for doc in cursor:
+            yield str(doc["entry_id"])
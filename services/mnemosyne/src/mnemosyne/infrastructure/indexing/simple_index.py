@@ -1,29 +1,78 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set
+import heapq
+import math
+from array import array
+from collections import Counter
+from typing import Collection, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from mnemosyne.domain.contracts import TextIndex
 from mnemosyne.domain.entities.models import KnowledgeEntry
+from mnemosyne.infrastructure.indexing.tokenizer import tokenize
+
+_Fields = Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str], str]
 
 
 class SimpleTextIndex(TextIndex):
-    def __init__(self) -> None:
-        self._index: Dict[str, Dict[str, object]] = {}
+    """
+    In-memory inverted index.
+
+    Every indexed entry gets a dense document number; terms, tags, taxonomy and source types map to
+    posting sets of those numbers. Search intersects the postings smallest-first, so its cost follows
+    the selectivity of the query instead of the corpus size.
+
+    Term postings also carry term frequencies and document lengths live in an array indexed by
+    document number, so ``search_ranked`` can score matches with BM25 without touching the text.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._doc_ids: List[str] = []
+        self._docnums: Dict[str, int] = {}
+        self._fields: Dict[int, _Fields] = {}
+        self._doc_lengths = array("I")
+        self._total_length = 0
+        self._terms: Dict[str, Dict[int, int]] = {}
+        self._tags: Dict[str, Set[int]] = {}
+        self._taxonomy: Dict[str, Set[int]] = {}
+        self._source_types: Dict[str, Set[int]] = {}
 
     def index(self, entry: KnowledgeEntry) -> None:
         version = entry.latest_version
         if not version:
             return
 
-        text_blob = f"{version.normalized_content}\n{version.summary}".lower()
-        tags = {tag.key for tag in version.tags}
-        taxonomy = set(version.taxonomy)
-        self._index[entry.id] = {
-            "text": text_blob,
-            "tags": tags,
-            "taxonomy": taxonomy,
-            "source_type": entry.source.type.value,
-        }
+        docnum = self._docnums.get(entry.id)
+        if docnum is None:
+            docnum = len(self._doc_ids)
+            self._doc_ids.append(entry.id)
+            self._docnums[entry.id] = docnum
+            self._doc_lengths.append(0)
+        else:
+            self._unindex(docnum)
+
+        tokens = tokenize(f"{version.normalized_content}\n{version.summary}")
+        frequencies = Counter(tokens)
+        fields: _Fields = (
+            frozenset(frequencies),
+            frozenset(tag.key for tag in version.tags),
+            frozenset(version.taxonomy),
+            entry.source.type.value,
+        )
+        _, tags, taxonomy, source_type = fields
+        for term, frequency in frequencies.items():
+            self._terms.setdefault(term, {})[docnum] = frequency
+        self._doc_lengths[docnum] = len(tokens)
+        self._total_length += len(tokens)
+        _add_postings(self._tags, tags, docnum)
+        _add_postings(self._taxonomy, taxonomy, docnum)
+        _add_postings(self._source_types, (source_type,), docnum)
+        self._fields[docnum] = fields
+
+    def index_many(self, entries: List[KnowledgeEntry]) -> None:
+        for entry in entries:
+            self.index(entry)
 
     def search(
         self,
@@ -32,20 +81,127 @@ class SimpleTextIndex(TextIndex):
         taxonomy: Optional[List[str]] = None,
         source_types: Optional[List[str]] = None,
     ) -> List[str]:
-        query = (text or "").lower()
-        tag_filter: Set[str] = set(tags or [])
-        taxonomy_filter: Set[str] = set(taxonomy or [])
-        source_filter: Set[str] = set(source_types or [])
-
-        results: List[str] = []
-        for entry_id, doc in self._index.items():
-            if query and query not in doc["text"]:
-                continue
-            if tag_filter and not (tag_filter & doc["tags"]):
+        postings = self._candidate_postings(text, tags, taxonomy, source_types)
+        if postings is None:
+            return []
+        if not postings:
+            return [self._doc_ids[docnum] for docnum in sorted(self._fields)]
+        return [self._doc_ids[docnum] for docnum in sorted(_intersect(postings))]
+
+    def search_ranked(
+        self,
+        text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        taxonomy: Optional[List[str]] = None,
+        source_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Tuple[str, float]]:
+        """Return ``(entry_id, score)`` pairs ordered by BM25 score, ties broken by insertion order."""
+        postings = self._candidate_postings(text, tags, taxonomy, source_types)
+        if postings is None:
+            return []
+        matches: Iterable[int] = _intersect(postings) if postings else self._fields
+        query_terms = set(tokenize(text)) if text else set()
+        if query_terms:
+            scored = [(-self._bm25(docnum, query_terms), docnum) for docnum in matches]
+        else:
+            scored = [(0.0, docnum) for docnum in matches]
+
+        if limit is None:
+            page = sorted(scored)[offset:]
+        else:
+            page = heapq.nsmallest(offset + limit, scored)[offset:]
+        return [(self._doc_ids[docnum], -negated + 0.0) for negated, docnum in page]
+
+    def _bm25(self, docnum: int, query_terms: Set[str]) -> float:
+        doc_count = len(self._fields)
+        avg_length = self._total_length / doc_count if doc_count else 0.0
+        length_norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[docnum] / avg_length) if avg_length else self.k1
+        score = 0.0
+        for term in query_terms:
+            term_postings = self._terms.get(term)
+            if not term_postings:
                 continue
-            if taxonomy_filter and not (taxonomy_filter & doc["taxonomy"]):
+            frequency = term_postings.get(docnum)
+            if not frequency:
                 continue
-            if source_filter and doc["source_type"] not in source_filter:
+            doc_freq = len(term_postings)
+            idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+            score += idf * frequency * (self.k1 + 1) / (frequency + length_norm)
+        return score
+
+    def _candidate_postings(
+        self,
+        text: Optional[str],
+        tags: Optional[List[str]],
+        taxonomy: Optional[List[str]],
+        source_types: Optional[List[str]],
+    ) -> Optional[List[Collection[int]]]:
+        """Collect one posting set per constraint; ``None`` means some constraint cannot match."""
+        postings: List[Collection[int]] = []
+        if text:
+            tokens = tokenize(text)
+            if not tokens:
+                return None
+            for token in tokens:
+                term_postings = self._terms.get(token)
+                if not term_postings:
+                    return None
+                postings.append(term_postings)
+        for table, values in ((self._tags, tags), (self._taxonomy, taxonomy), (self._source_types, source_types)):
+            if not values:
                 continue
-            results.append(entry_id)
-        return results
+            union = _union(table, values)
+            if not union:
+                return None
+            postings.append(union)
+        return postings
+
+    def _unindex(self, docnum: int) -> None:
+        fields = self._fields.pop(docnum, None)
+        if not fields:
+            return
+        terms, tags, taxonomy, source_type = fields
+        for term in terms:
+            term_postings = self._terms[term]
+            del term_postings[docnum]
+            if not term_postings:
+                del self._terms[term]
+        self._total_length -= self._doc_lengths[docnum]
+        self._doc_lengths[docnum] = 0
+        _remove_postings(self._tags, tags, docnum)
+        _remove_postings(self._taxonomy, taxonomy, docnum)
+        _remove_postings(self._source_types, (source_type,), docnum)
+
+
+def _add_postings(table: Dict[str, Set[int]], keys: Iterable[str], docnum: int) -> None:
+    for key in keys:
+        table.setdefault(key, set()).add(docnum)
+
+
+def _remove_postings(table: Dict[str, Set[int]], keys: Iterable[str], docnum: int) -> None:
+    for key in keys:
+        postings = table.get(key)
+        if postings is None:
+            continue
+        postings.discard(docnum)
+        if not postings:
+            del table[key]
+
+
+def _union(table: Dict[str, Set[int]], values: Iterable[str]) -> Set[int]:
+    matches = [table[value] for value in set(values) if value in table]
+    if len(matches) == 1:
+        return matches[0]
+    return set().union(*matches)
+
+
+def _intersect(postings: List[Collection[int]]) -> Set[int]:
+    ordered = sorted(postings, key=len)
+    result = set(ordered[0])
+    for other in ordered[1:]:
+        result = {docnum for docnum in result if docnum in other}
+        if not result:
+            break
+    return result
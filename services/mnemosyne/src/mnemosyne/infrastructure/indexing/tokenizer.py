@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import re
+from typing import List
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens, keeping their original order."""
+    return _TOKEN_RE.findall(text.lower())
@@ -15,18 +15,34 @@ class InMemoryKnowledgeRepository(KnowledgeRepository):
     def get_entry(self, entry_id: str) -> Optional[KnowledgeEntry]:
         return self._entries.get(entry_id)
 
+    def get_entries(self, entry_ids: List[str]) -> List[KnowledgeEntry]:
+        entries = (self._entries.get(entry_id) for entry_id in entry_ids)
+        return [entry for entry in entries if entry]
+
     def save_entry(self, entry: KnowledgeEntry) -> None:
         self._entries[entry.id] = entry
 
+    def save_entries(self, entries: List[KnowledgeEntry]) -> None:
+        for entry in entries:
+            self._entries[entry.id] = entry
+
     def list_entries(self) -> Iterable[KnowledgeEntry]:
         return list(self._entries.values())
 
     def record_run(self, run: IngestionRun) -> None:
         self._runs[run.run_id] = run
 
+    def record_runs(self, runs: List[IngestionRun]) -> None:
+        for run in runs:
+            self._runs[run.run_id] = run
+
     def get_run(self, run_id: str) -> Optional[IngestionRun]:
         return self._runs.get(run_id)
 
+    def get_runs(self, run_ids: List[str]) -> List[IngestionRun]:
+        runs = (self._runs.get(run_id) for run_id in run_ids)
+        return [run for run in runs if run]
+
     def record_audit_events(self, events: List[AuditEvent]) -> None:
         self._audit_events.extend(events)
 
@@ -4,7 +4,7 @@ import os
 from datetime import datetime
 from typing import Dict, Iterable, List, Optional
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.collection import Collection
 
 from mnemosyne.domain.contracts import KnowledgeRepository
@@ -51,26 +51,53 @@ class MongoKnowledgeRepository(KnowledgeRepository):
             return None
         return self._entry_from_doc(doc)
 
+    def get_entries(self, entry_ids: List[str]) -> List[KnowledgeEntry]:
+        if not entry_ids:
+            return []
+        docs = {doc["id"]: doc for doc in self._entries.find({"id": {"$in": list(set(entry_ids))}})}
+        return [self._entry_from_doc(docs[entry_id]) for entry_id in entry_ids if entry_id in docs]
+
     def save_entry(self, entry: KnowledgeEntry) -> None:
         doc = self._entry_to_doc(entry)
         self._entries.update_one({"id": entry.id}, {"$set": doc}, upsert=True)
 
+    def save_entries(self, entries: List[KnowledgeEntry]) -> None:
+        if not entries:
+            return
+        self._entries.bulk_write(
+            [UpdateOne({"id": entry.id}, {"$set": self._entry_to_doc(entry)}, upsert=True) for entry in entries],
+            ordered=False,
+        )
+
     def list_entries(self) -> Iterable[KnowledgeEntry]:
         return [self._entry_from_doc(doc) for doc in self._entries.find({})]
 
     def record_run(self, run: IngestionRun) -> None:
         self._runs.update_one({"run_id": run.run_id}, {"$set": self._run_to_doc(run)}, upsert=True)
 
+    def record_runs(self, runs: List[IngestionRun]) -> None:
+        if not runs:
+            return
+        self._runs.bulk_write(
+            [UpdateOne({"run_id": run.run_id}, {"$set": self._run_to_doc(run)}, upsert=True) for run in runs],
+            ordered=False,
+        )
+
     def get_run(self, run_id: str) -> Optional[IngestionRun]:
         doc = self._runs.find_one({"run_id": run_id})
         if not doc:
             return None
         return self._run_from_doc(doc)
 
+    def get_runs(self, run_ids: List[str]) -> List[IngestionRun]:
+        if not run_ids:
+            return []
+        return [self._run_from_doc(doc) for doc in self._runs.find({"run_id": {"$in": list(set(run_ids))}})]
+
     def record_audit_events(self, events: List[AuditEvent]) -> None:
         if not events:
             return
-        self._audit.insert_many([self._audit_to_doc(evt) for evt in events])
+        self._audit.insert_many([self._audit_to_doc(evt) for evt in events], ordered=False)
 
     # --- Serialization helpers ---
     def _entry_to_doc(self, entry: KnowledgeEntry) -> Dict:
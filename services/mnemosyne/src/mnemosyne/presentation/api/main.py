@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import json
 import os
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import Annotated, AsyncIterator, List, Optional
 
-from fastapi import Depends, FastAPI, Header, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 
 from mnemosyne.application.use_cases.ingest import IngestionPipeline, IngestionRequest
 from mnemosyne.application.use_cases.reprocess import ReprocessIngestionUseCase
@@ -15,7 +20,13 @@ from mnemosyne.infrastructure.observability import Observability
 from mnemosyne.infrastructure.persistence import InMemoryKnowledgeRepository, MongoKnowledgeRepository
 from mnemosyne.infrastructure.storage import S3RawDocumentStorage
 
-app = FastAPI(title="Mnemosyne", version="0.1.1")
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    pipeline.close()
+
+
+app = FastAPI(title="Mnemosyne", version="0.1.1", lifespan=lifespan)
 observability = Observability(service_name="mnemosyne")
 observability.instrument_fastapi(app)
 
@@ -64,6 +75,49 @@ def _to_ingestion_requests(payloads: List["IngestionPayload"]) -> List[Ingestion
     return requests
 
 
+async def _iter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into non-empty lines without buffering more than the current line."""
+    parts: List[bytes] = []
+    async for chunk in chunks:
+        pieces = chunk.split(b"\n")
+        if len(pieces) == 1:
+            parts.append(chunk)
+            continue
+        parts.append(pieces[0])
+        for line in [b"".join(parts), *pieces[1:-1]]:
+            if line.strip():
+                yield line
+        parts = [pieces[-1]]
+    tail = b"".join(parts)
+    if tail.strip():
+        yield tail
+
+
+async def _stream_ingestion(lines: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    batch: List[IngestionPayload] = []
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        try:
+            batch.append(IngestionPayload.model_validate_json(line))
+        except ValidationError as exc:
+            yield json.dumps({"line": line_number, "error": exc.errors(include_url=False)}, default=str) + "\n"
+            continue
+        if len(batch) >= STREAM_CHUNK_SIZE:
+            for result in await _ingest_chunk(batch):
+                yield result
+            batch = []
+    if batch:
+        for result in await _ingest_chunk(batch):
+            yield result
+
+
+async def _ingest_chunk(batch: List["IngestionPayload"]) -> List[str]:
+    results = await run_in_threadpool(pipeline.run, _to_ingestion_requests(batch))
+    observability.ingestions_counter.add(len(results))
+    return [json.dumps(asdict(result)) + "\n" for result in results]
+
+
 class TagModel(BaseModel):
     key: str
     value: str | None = None
@@ -145,11 +199,13 @@ def _serialize_audit(events: List[AuditEvent]) -> List[AuditEventOut]:
 
 PERSISTENCE_BACKEND = os.getenv("MNEMO_PERSISTENCE", "memory").lower()
 S3_BUCKET = os.getenv("MNEMO_S3_BUCKET")
+INGEST_WORKERS = int(os.getenv("MNEMO_INGEST_WORKERS", "0"))
+STREAM_CHUNK_SIZE = int(os.getenv("MNEMO_STREAM_CHUNK_SIZE", "500"))
 
 repository = _build_repository()
 index = _build_index(repository)
 storage = _build_storage()
-pipeline = IngestionPipeline(repository=repository, index=index, storage=storage)
+pipeline = IngestionPipeline(repository=repository, index=index, storage=storage, workers=INGEST_WORKERS)
 search_use_case = SearchKnowledgeUseCase(repository=repository, index=index)
 reprocess_use_case = ReprocessIngestionUseCase(repository=repository, pipeline=pipeline)
 
@@ -167,17 +223,33 @@ def ingest(documents: List[IngestionPayload]):
     return results
 
 
+@app.post("/ingestions/stream", dependencies=[Depends(require_api_key)])
+async def ingest_stream(request: Request):
+    """Ingest an NDJSON body in bounded chunks, answering with one NDJSON result per document."""
+    lines = _iter_ndjson_lines(request.stream())
+    return StreamingResponse(_stream_ingestion(lines), media_type="application/x-ndjson")
+
+
 @app.get("/search", dependencies=[Depends(require_api_key)])
 def search(
     text: str | None = None,
     tags: str | None = None,
     source_types: str | None = None,
     taxonomy: str | None = None,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
 ):
     tag_list = tags.split(",") if tags else None
     source_type_list = source_types.split(",") if source_types else None
     taxonomy_list = taxonomy.split(",") if taxonomy else None
-    results = search_use_case.execute(text=text, tags=tag_list, source_types=source_type_list, taxonomy=taxonomy_list)
+    results = search_use_case.execute(
+        text=text,
+        tags=tag_list,
+        source_types=source_type_list,
+        taxonomy=taxonomy_list,
+        limit=limit,
+        offset=offset,
+    )
     observability.search_counter.add(len(results))
     return [_serialize_entry(entry) for entry in results]
 
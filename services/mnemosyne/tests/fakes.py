@@ -0,0 +1,108 @@
+"""In-process stand-ins for the pymongo objects used by the Mongo adapters."""
+
+
+def _matches(doc, filter_doc):
+    for k, v in filter_doc.items():
+        value = doc.get(k)
+        if isinstance(v, dict) and "$in" in v:
+            if isinstance(value, list):
+                if not set(value) & set(v["$in"]):
+                    return False
+            elif value not in v["$in"]:
+                return False
+        elif isinstance(v, dict) and "$all" in v:
+            if not set(v["$all"]) <= set(value or []):
+                return False
+        elif value != v:
+            return False
+    return True
+
+
+def _project(doc, projection):
+    if not projection:
+        return doc
+    included = [k for k, v in projection.items() if v and k != "_id"]
+    if included:
+        return {k: doc[k] for k in included if k in doc}
+    return {k: v for k, v in doc.items() if k not in projection}
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def batch_size(self, _size):
+        return self
+
+    def skip(self, count):
+        self._docs = self._docs[count:]
+        return self
+
+    def limit(self, count):
+        if count:
+            self._docs = self._docs[:count]
+        return self
+
+    def __iter__(self):
+        return iter(self._docs)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+        self.find_calls = 0
+        self.write_calls = 0
+
+    def create_index(self, *args, **kwargs):
+        return None
+
+    def update_one(self, filter_doc, update_doc, upsert=False):
+        self.write_calls += 1
+        self._apply(filter_doc, update_doc)
+
+    def _apply(self, filter_doc, update_doc):
+        _id = filter_doc.get("id") or filter_doc.get("entry_id") or filter_doc.get("run_id")
+        if not _id:
+            raise ValueError("id required")
+        set_doc = update_doc.get("$set", update_doc)
+        self.docs[_id] = set_doc
+
+    def find_one(self, filter_doc):
+        _id = filter_doc.get("id") or filter_doc.get("entry_id") or filter_doc.get("run_id")
+        return self.docs.get(_id)
+
+    def bulk_write(self, operations, ordered=True):
+        self.write_calls += 1
+        for op in operations:
+            self._apply(op._filter, op._doc)
+
+    def insert_many(self, docs, ordered=True):
+        self.write_calls += 1
+        for doc in docs:
+            key = doc.get("id") or doc.get("entry_id") or doc.get("run_id") or len(self.docs)
+            self.docs[str(key)] = doc
+
+    def find(self, filter_doc=None, projection=None):
+        self.find_calls += 1
+        docs = [doc for doc in self.docs.values() if _matches(doc, filter_doc or {})]
+        return FakeCursor(_project(doc, projection) for doc in docs)
+
+
+class FakeDB:
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, item):
+        if item not in self.collections:
+            self.collections[item] = FakeCollection()
+        return self.collections[item]
+
+
+class FakeMongoClient:
+    def __init__(self):
+        self.dbs = {}
+
+    def __getitem__(self, name):
+        if name not in self.dbs:
+            self.dbs[name] = FakeDB()
+        return self.dbs[name]
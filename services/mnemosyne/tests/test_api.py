@@ -1,6 +1,8 @@
+import json
 from importlib import reload
 
 import pytest
+from fastapi.testclient import TestClient
 
 from mnemosyne.presentation.api import main
 
@@ -18,3 +20,24 @@ def test_api_requires_key(monkeypatch):
     # valid key should pass
     main.require_api_key("secret")
     assert main.search() == []
+
+
+def test_streaming_ingestion_accepts_ndjson(monkeypatch):
+    monkeypatch.delenv("MNEMO_API_KEY", raising=False)
+    reload(main)
+    monkeypatch.setattr(main, "STREAM_CHUNK_SIZE", 2)
+    client = TestClient(main.app)
+
+    lines = [
+        json.dumps({"external_id": str(i), "source": {"id": "ops", "name": "Ops"}, "content": f"log line {i}"})
+        for i in range(5)
+    ]
+    lines.insert(2, '{"external_id": "broken"}')
+    response = client.post("/ingestions/stream", content="\n".join(lines) + "\n\n")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["entry_id"] for r in records if "entry_id" in r] == [f"ops:{i}" for i in range(5)]
+    assert [r["line"] for r in records if "error" in r] == [3]
+    assert len(main.search_use_case.execute(text="log")) == 5
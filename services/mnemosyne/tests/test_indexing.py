@@ -0,0 +1,71 @@
+from mnemosyne.domain.entities.models import KnowledgeEntry, Source, SourceType, Tag, Version
+from mnemosyne.infrastructure.indexing.mongo_index import MongoTextIndex
+from mnemosyne.infrastructure.indexing.simple_index import SimpleTextIndex
+
+from fakes import FakeMongoClient
+
+
+def make_entry(entry_id, content, source_type=SourceType.AEGIS, tags=(), taxonomy=()):
+    entry = KnowledgeEntry(id=entry_id, source=Source(id="src", name="Src", type=source_type), external_id=entry_id)
+    entry.add_version(
+        Version(
+            fingerprint=entry_id,
+            normalized_content=content,
+            summary="",
+            tags=[Tag(key=t) for t in tags],
+            taxonomy=list(taxonomy),
+        )
+    )
+    return entry
+
+
+def test_inverted_index_intersects_terms_and_filters():
+    index = SimpleTextIndex()
+    index.index(make_entry("a", "DB outage in prod", tags=["sev1"], taxonomy=["incidents"]))
+    index.index(make_entry("b", "Outage of the cache layer", tags=["sev2"], taxonomy=["incidents"]))
+    index.index(make_entry("c", "ADR: switch to MongoDB", source_type=SourceType.ATLAS_FORGE, tags=["architecture"]))
+
+    assert index.search(text="outage") == ["a", "b"]
+    assert index.search(text="prod OUTAGE") == ["a"]
+    assert index.search(text="outage", tags=["sev2", "missing"]) == ["b"]
+    assert index.search(taxonomy=["incidents"], source_types=[SourceType.ATLAS_FORGE.value]) == []
+    assert index.search(text="unknown") == []
+    assert index.search() == ["a", "b", "c"]
+
+
+def test_reindexing_an_entry_replaces_its_postings():
+    index = SimpleTextIndex()
+    index.index(make_entry("a", "first draft", tags=["draft"]))
+    index.index(make_entry("a", "final text", tags=["final"]))
+
+    assert index.search(text="draft") == []
+    assert index.search(tags=["draft"]) == []
+    assert index.search(text="final", tags=["final"]) == ["a"]
+
+
+def test_ranked_search_orders_by_bm25_and_pages():
+    index = SimpleTextIndex()
+    index.index(make_entry("a", "outage report for the billing service"))
+    index.index(make_entry("b", "outage outage outage in prod"))
+    index.index(make_entry("c", "routine maintenance window"))
+
+    ranked = index.search_ranked(text="outage")
+    assert [entry_id for entry_id, _ in ranked] == ["b", "a"]
+    assert ranked[0][1] > ranked[1][1] > 0
+
+    assert index.search_ranked(text="outage", limit=1, offset=1) == [ranked[1]]
+    assert index.search_ranked(limit=2) == [("a", 0.0), ("b", 0.0)]
+
+
+def test_mongo_index_filters_server_side_and_projects_entry_ids():
+    collection = FakeMongoClient()["mnemosyne"]["index"]
+    index = MongoTextIndex(collection)
+    index.index(make_entry("a", "DB outage in prod", tags=["sev1"], taxonomy=["incidents"]))
+    index.index(make_entry("b", "Outage of the cache layer", tags=["sev2"], taxonomy=["incidents"]))
+    index.index(make_entry("c", "ADR: switch to MongoDB", source_type=SourceType.ATLAS_FORGE))
+
+    assert index.search(text="prod outage") == ["a"]
+    assert index.search(text="outage", tags=["sev2"], taxonomy=["incidents"]) == ["b"]
+    assert index.search(source_types=[SourceType.ATLAS_FORGE.value]) == ["c"]
+    assert index.search_ranked(text="outage", limit=1, offset=1) == [("b", 0.0)]
+    assert index.search(text="!!!") == []
@@ -8,6 +8,8 @@ from mnemosyne.infrastructure.persistence.in_memory import InMemoryKnowledgeRepo
 from mnemosyne.infrastructure.persistence.mongo import MongoKnowledgeRepository
 from mnemosyne.infrastructure.storage.s3 import S3RawDocumentStorage
 
+from fakes import FakeMongoClient
+
 
 def build_pipeline():
     repository = InMemoryKnowledgeRepository()
@@ -87,68 +89,6 @@ def test_reprocess_is_idempotent():
     assert len(entry.versions) == 1
 
 
-class FakeCollection:
-    def __init__(self):
-        self.docs = {}
-
-    def create_index(self, *args, **kwargs):
-        return None
-
-    def update_one(self, filter_doc, update_doc, upsert=False):
-        _id = filter_doc.get("id") or filter_doc.get("entry_id") or filter_doc.get("run_id")
-        if not _id:
-            raise ValueError("id required")
-        set_doc = update_doc.get("$set", update_doc)
-        self.docs[_id] = set_doc
-
-    def find_one(self, filter_doc):
-        _id = filter_doc.get("id") or filter_doc.get("entry_id") or filter_doc.get("run_id")
-        return self.docs.get(_id)
-
-    def insert_many(self, docs):
-        for doc in docs:
-            key = doc.get("id") or doc.get("entry_id") or doc.get("run_id") or len(self.docs)
-            self.docs[str(key)] = doc
-
-    def find(self, filter_doc=None):
-        if not filter_doc:
-            return list(self.docs.values())
-        results = []
-        for doc in self.docs.values():
-            match = True
-            for k, v in filter_doc.items():
-                if isinstance(v, dict) and "$in" in v:
-                    if doc.get(k) not in v["$in"]:
-                        match = False
-                        break
-                elif doc.get(k) != v:
-                    match = False
-                    break
-            if match:
-                results.append(doc)
-        return results
-
-
-class FakeDB:
-    def __init__(self):
-        self.collections = {}
-
-    def __getitem__(self, item):
-        if item not in self.collections:
-            self.collections[item] = FakeCollection()
-        return self.collections[item]
-
-
-class FakeMongoClient:
-    def __init__(self):
-        self.dbs = {}
-
-    def __getitem__(self, name):
-        if name not in self.dbs:
-            self.dbs[name] = FakeDB()
-        return self.dbs[name]
-
-
 def test_mongo_repository_and_index():
     client = FakeMongoClient()
     repo = MongoKnowledgeRepository(client=client)
@@ -160,6 +100,7 @@ def test_mongo_repository_and_index():
 
     entry = repo.get_entry("aegis-1:1")
     assert entry and entry.latest_version
+    assert [e.id for e in repo.get_entries(["missing", "aegis-1:1"])] == ["aegis-1:1"]
     results = index.search(text="outage", source_types=[SourceType.AEGIS.value])
     assert entry.id in results
     run_id = next(iter(repo._runs.docs.keys()))  # type: ignore[attr-defined]
@@ -184,3 +125,68 @@ def test_s3_storage_is_used(monkeypatch):
     assert stored  # content written
     entry = next(iter(repo.list_entries()))
     assert entry.latest_version and entry.latest_version.raw_uri.endswith("abc.txt")
+
+
+def test_search_limit_hydrates_only_requested_page():
+    repo, pipeline, search, _ = build_pipeline()
+    source = Source(id="ops-1", name="Ops", type=SourceType.EYE_OF_HORUS_OPS)
+    pipeline.run(
+        [
+            IngestionRequest(external_id=str(i), source=source, content="disk outage " + "outage " * i)
+            for i in range(5)
+        ]
+    )
+
+    fetched = []
+    original_get_entries = repo.get_entries
+
+    def tracking_get_entries(entry_ids):
+        fetched.append(list(entry_ids))
+        return original_get_entries(entry_ids)
+
+    repo.get_entries = tracking_get_entries
+    results = search.execute(text="outage", limit=2)
+    assert len(fetched) == 1
+    assert [e.id for e in results] == fetched[0] == ["ops-1:4", "ops-1:3"]
+
+
+def test_batch_ingestion_uses_bulk_round_trips():
+    client = FakeMongoClient()
+    repo = MongoKnowledgeRepository(client=client)
+    index = MongoTextIndex(client["mnemosyne"]["index"])
+    pipeline = IngestionPipeline(repository=repo, index=index)
+    source = Source(id="aegis-1", name="Aegis", type=SourceType.AEGIS)
+    requests = [IngestionRequest(external_id=str(i), source=source, content=f"report {i}") for i in range(50)]
+    requests.append(IngestionRequest(external_id="0", source=source, content="report 0"))
+    requests.append(IngestionRequest(external_id="0", source=source, content="report 0 updated", run_id="r-1"))
+    requests.append(IngestionRequest(external_id="0", source=source, content="ignored", run_id="r-1"))
+
+    results = pipeline.run(requests)
+
+    db = client["mnemosyne"]
+    assert [db[name].write_calls for name in ("entries", "runs", "audit", "index")] == [1, 1, 1, 1]
+    assert db["entries"].find_calls == 1 and db["runs"].find_calls == 1
+    assert len(results) == 53
+    assert results[50].deduplicated is True
+    assert results[51].deduplicated is False
+    assert results[52] == results[51]
+    assert len(repo.get_entry("aegis-1:0").versions) == 2
+
+
+def test_parallel_preprocessing_matches_inline():
+    source = Source(id="ops", name="Ops", type=SourceType.EYE_OF_HORUS_OPS)
+    requests = [
+        IngestionRequest(external_id=str(i), source=source, content=f"  line {i}\n   second line  ", run_id=f"r-{i}")
+        for i in range(8)
+    ]
+    inline = build_pipeline()[1].run(requests)
+
+    repository = InMemoryKnowledgeRepository()
+    pipeline = IngestionPipeline(repository=repository, index=SimpleTextIndex(), workers=2, parallel_min_bytes=0)
+    try:
+        parallel = pipeline.run(requests)
+    finally:
+        pipeline.close()
+
+    assert [r.fingerprint for r in parallel] == [r.fingerprint for r in inline]
+    assert repository.get_entry("ops:3").latest_version.normalized_content == "line 3\nsecond line"